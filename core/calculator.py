@@ -1,245 +1,375 @@
-from decimal import Decimal, InvalidOperation, ROUND_HALF_UP, DivisionByZero
+import logging
+import re
+from decimal import Decimal
+from functools import lru_cache
+
+log = logging.getLogger(__name__)
+
+# Matches "16:9" style ratios and bare numbers like "1.777" in one scan.
+_RATIO_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(?::\s*(\d+(?:\.\d+)?)\s*)?$")
+
+@lru_cache(maxsize=64)
+def _parse_ratio(ratio_str: str) -> float:
+    """Parses a 'W:H' or bare-number ratio string into a W/H float.
+
+    Raises ValueError for anything the fixed grammar does not accept.
+    Memoized: users re-enter the same few ratio strings repeatedly.
+    """
+    match = _RATIO_RE.match(ratio_str)
+    if not match:
+        raise ValueError("Invalid ratio format. Use W:H (e.g., 16:9)")
+    w_text, h_text = match.group(1, 2)
+    if h_text is None:
+        # Bare decimal number (e.g., 1.777)
+        return _round6(float(w_text))
+    w_part = float(w_text)
+    h_part = float(h_text)
+    if w_part <= 0 or h_part <= 0:
+        raise ValueError("Ratio parts must be positive")
+    return _round6(w_part / h_part)
+
+# Dimensions are stored as integers in hundredths of a pixel (fixed point
+# at the 0.01 display precision), so quantization is a single int round.
+def _to_cents(value: float) -> int:
+    """Quantizes a value to integer hundredths (dimension display precision)."""
+    return int(round(float(value) * 100))
+
+def _round6(value: float) -> float:
+    """Rounds to six decimal places (aspect ratio precision)."""
+    return round(value, 6)
+
+@lru_cache(maxsize=512)
+def _format_ratio_str(ratio: float) -> str:
+    """Formats a W/H ratio for display; memoized since drags revisit the
+    same handful of ratios over and over."""
+    # Basic float representation for now
+    # TODO: Implement common fraction representation (e.g., 16:9)
+    return f"{ratio:.3f}:1" # Display more precision
+
+# Optional JIT for the pure-numeric kernels below. Numba compiles them to
+# native code when installed; otherwise the plain Python definitions run
+# unchanged, so the dependency stays optional.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def _decorator(func):
+            return func
+        return _decorator
+
+@njit(cache=True)
+def _height_h_from_ratio(width_h: int, ratio: float) -> int:
+    """Height (in hundredths) matching the given width at a W:H ratio."""
+    return int(round(width_h / ratio))
+
+@njit(cache=True)
+def _width_h_from_ratio(height_h: int, ratio: float) -> int:
+    """Width (in hundredths) matching the given height at a W:H ratio."""
+    return int(round(height_h * ratio))
+
+@njit(cache=True)
+def _ratio_from_dims_h(width_h: int, height_h: int) -> float:
+    """W:H ratio of hundredths dimensions, in 6-decimal precision."""
+    return round(width_h / height_h * 1000000) / 1000000.0
+
+@njit(cache=True)
+def _scale_dims_h(width_h: int, height_h: int, factor: float) -> tuple[int, int]:
+    """Scales both hundredths dimensions by a factor."""
+    return int(round(width_h * factor)), int(round(height_h * factor))
 
 class ResolutionCalculator:
     """Handles resolution and aspect ratio calculations."""
+    __slots__ = ("_width_h", "_height_h", "_aspect_ratio", "_ratio_locked", "_ratio_dirty",
+                 "_derived_key", "_derived")
+
     def __init__(self):
-        self._width: Decimal = Decimal("1920")
-        self._height: Decimal = Decimal("1080")
-        self._aspect_ratio: Decimal | None = None
+        self._width_h: int = 192000 # 1920.00 in hundredths
+        self._height_h: int = 108000 # 1080.00 in hundredths
+        self._aspect_ratio: float | None = None
         self._ratio_locked: bool = False
+        self._ratio_dirty: bool = False
+        # Display-value cache: one (state key, values) pair so a UI refresh
+        # reading several derived properties computes them only once.
+        self._derived_key: tuple | None = None
+        self._derived: tuple | None = None
         self._calculate_ratio()
 
     @property
-    def width(self) -> Decimal:
-        return self._width
+    def width(self) -> float:
+        return self._width_h / 100.0
 
     @width.setter
     def width(self, value: str | float | Decimal):
-        print(f"[Calc Debug] Setting width. Current locked: {self._ratio_locked}, ratio: {self._aspect_ratio}") # Debug print
+        log.debug("Setting width. Current locked: %s, ratio: %s", self._ratio_locked, self._aspect_ratio)
         try:
-            new_width = Decimal(value).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            if new_width <= 0:
+            new_width_h = _to_cents(value)
+            if new_width_h <= 0:
                 raise ValueError("Width must be positive")
 
+            # Re-emissions of the current value (common in Qt signal
+            # cascades) are a no-op unless the lock has to re-derive height.
+            if new_width_h == self._width_h and not self._ratio_locked:
+                return
+
             if self._ratio_locked and self._aspect_ratio is not None and self._aspect_ratio != 0:
-                print("[Calc Debug] Width setter: Lock active, calculating height.") # Debug print
-                new_height = (new_width / self._aspect_ratio).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-                if new_height <= 0:
-                     print("[Calc Debug Warning] Calculated height would be non-positive. Width not changed.")
+                log.debug("Width setter: Lock active, calculating height.")
+                new_height_h = _height_h_from_ratio(new_width_h, self._aspect_ratio)
+                if new_height_h <= 0:
+                     log.warning("Calculated height would be non-positive. Width not changed.")
                      return
-                self._height = new_height
+                self._height_h = new_height_h
 
-            self._width = new_width
+            self._width_h = new_width_h
             if not self._ratio_locked:
-                print("[Calc Debug] Width setter: Lock inactive, recalculating ratio.") # Debug print
-                self._calculate_ratio()
-            print(f"[Calc Debug] Width set. New W: {self._width}, H: {self._height}, Locked: {self._ratio_locked}") # Debug print
+                log.debug("Width setter: Lock inactive, marking ratio dirty.")
+                self._ratio_dirty = True
+            log.debug("Width set. New W: %s, H: %s, Locked: %s", self.width, self.height, self._ratio_locked)
 
-        except (InvalidOperation, ValueError) as e:
-            print(f"Error setting width: {e}")
+        except (TypeError, ValueError) as e:
+            log.error("Error setting width: %s", e)
 
     @property
-    def height(self) -> Decimal:
-        return self._height
+    def height(self) -> float:
+        return self._height_h / 100.0
 
     @height.setter
     def height(self, value: str | float | Decimal):
-        print(f"[Calc Debug] Setting height. Current locked: {self._ratio_locked}, ratio: {self._aspect_ratio}") # Debug print
+        log.debug("Setting height. Current locked: %s, ratio: %s", self._ratio_locked, self._aspect_ratio)
         try:
-            new_height = Decimal(value).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            if new_height <= 0:
+            new_height_h = _to_cents(value)
+            if new_height_h <= 0:
                 raise ValueError("Height must be positive")
 
+            # Re-emissions of the current value (common in Qt signal
+            # cascades) are a no-op unless the lock has to re-derive width.
+            if new_height_h == self._height_h and not self._ratio_locked:
+                return
+
             if self._ratio_locked and self._aspect_ratio is not None and self._aspect_ratio != 0:
-                print("[Calc Debug] Height setter: Lock active, calculating width.") # Debug print
-                new_width = (new_height * self._aspect_ratio).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-                if new_width <= 0:
-                    print("[Calc Debug Warning] Calculated width would be non-positive. Height not changed.")
+                log.debug("Height setter: Lock active, calculating width.")
+                new_width_h = _width_h_from_ratio(new_height_h, self._aspect_ratio)
+                if new_width_h <= 0:
+                    log.warning("Calculated width would be non-positive. Height not changed.")
                     return
-                self._width = new_width
+                self._width_h = new_width_h
 
-            self._height = new_height
+            self._height_h = new_height_h
             if not self._ratio_locked:
-                print("[Calc Debug] Height setter: Lock inactive, recalculating ratio.") # Debug print
-                self._calculate_ratio()
-            print(f"[Calc Debug] Height set. New W: {self._width}, H: {self._height}, Locked: {self._ratio_locked}") # Debug print
+                log.debug("Height setter: Lock inactive, marking ratio dirty.")
+                self._ratio_dirty = True
+            log.debug("Height set. New W: %s, H: %s, Locked: %s", self.width, self.height, self._ratio_locked)
 
-        except (InvalidOperation, ValueError) as e:
-            print(f"Error setting height: {e}")
+        except (TypeError, ValueError) as e:
+            log.error("Error setting height: %s", e)
 
     @property
-    def aspect_ratio(self) -> Decimal | None:
+    def aspect_ratio(self) -> float | None:
+        if self._ratio_dirty:
+            self._calculate_ratio()
         return self._aspect_ratio
 
     @property
     def aspect_ratio_str(self) -> str:
-        if self._aspect_ratio is None or self._aspect_ratio == 0:
-            return "N/A"
-        # Basic float representation for now
-        # TODO: Implement common fraction representation (e.g., 16:9)
-        return f"{self._aspect_ratio:.3f}:1" # Display more precision
+        return self._recompute_derived()[4]
+
+    @property
+    def width_slider_units(self) -> int:
+        """Width in hundredths of a pixel — the UI slider's native unit."""
+        return self._width_h
+
+    @property
+    def height_slider_units(self) -> int:
+        """Height in hundredths of a pixel — the UI slider's native unit."""
+        return self._height_h
 
     @property
     def is_ratio_locked(self) -> bool:
         return self._ratio_locked
 
     def lock_ratio(self, lock: bool):
-        lock = bool(lock) # Ensure boolean
-        print(f"[Calc Debug] lock_ratio called with: {lock}. Current state: {self._ratio_locked}") # Debug print
+        # No-op check first: callers (Qt checkbox, signal cascades) pass
+        # real booleans, so the old bool() coercion is unnecessary.
         if self._ratio_locked == lock:
-            print("[Calc Debug] lock_ratio: No change needed.") # Debug print
             return
 
+        log.debug("lock_ratio called with: %s. Current state: %s", lock, self._ratio_locked)
         self._ratio_locked = lock
         if lock:
-            print("[Calc Debug] lock_ratio: Locking ratio, calculating current.") # Debug print
+            log.debug("lock_ratio: Locking ratio, calculating current.")
             self._calculate_ratio()
-        print(f"[Calc Debug] lock_ratio finished. New state: {self._ratio_locked}, Ratio: {self._aspect_ratio}") # Debug print
+        log.debug("lock_ratio finished. New state: %s, Ratio: %s", self._ratio_locked, self._aspect_ratio)
 
-    def _calculate_ratio(self):
-        print("[Calc Debug] Calculating ratio...") # Debug print
-        if self._height > 0:
-            try:
-                self._aspect_ratio = (self._width / self._height).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP) # Increased precision slightly
-            except Exception as e:
-                print(f"Error calculating ratio: {e}")
-                self._aspect_ratio = None
+    def _assign_dims_h(self, width_h: int, height_h: int):
+        """Assigns both hundredths dimensions with a single ratio update."""
+        self._width_h = width_h
+        self._height_h = height_h
+        if self._ratio_locked:
+            self._calculate_ratio()
         else:
-            self._aspect_ratio = None
-        print(f"[Calc Debug] Ratio calculated: {self._aspect_ratio}") # Debug print 
+            self._ratio_dirty = True
+
+    def set_dimensions(self, width: str | float | Decimal, height: str | float | Decimal):
+        """Sets width and height together, recomputing the ratio only once.
+
+        Prefer this over assigning the two setters in sequence: it skips the
+        intermediate ratio/lock bookkeeping a paired update would run twice.
+        """
+        log.debug("set_dimensions called. W: %s, H: %s", width, height)
+        try:
+            new_width_h = _to_cents(width)
+            new_height_h = _to_cents(height)
+            if new_width_h <= 0 or new_height_h <= 0:
+                raise ValueError("Dimensions must be positive")
+            self._assign_dims_h(new_width_h, new_height_h)
+        except (TypeError, ValueError) as e:
+            log.error("Error setting dimensions: %s", e)
+
+    def _calculate_ratio(self):
+        # Plain truthiness guard: the setters only ever store positive values.
+        self._aspect_ratio = _ratio_from_dims_h(self._width_h, self._height_h) if self._height_h else None
+        self._ratio_dirty = False
+        log.debug("Ratio calculated: %s", self._aspect_ratio)
 
     def set_ratio_and_calculate(self, ratio_str: str, base_on_width: bool):
         """Parses a ratio string (e.g., '16:9') and updates width or height based on the selected base."""
-        print(f"[Calc Debug] set_ratio_and_calculate called. Ratio: '{ratio_str}', BaseWidth: {base_on_width}")
+        log.debug("set_ratio_and_calculate called. Ratio: %r, BaseWidth: %s", ratio_str, base_on_width)
         try:
-            # Parse the ratio string
-            if ':' not in ratio_str:
-                # Try parsing as a single decimal number (e.g., 1.777)
-                target_ratio = Decimal(ratio_str).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
-            else:
-                parts = ratio_str.split(':')
-                if len(parts) != 2:
-                    raise ValueError("Invalid ratio format. Use W:H (e.g., 16:9)")
-                w_part = Decimal(parts[0].strip())
-                h_part = Decimal(parts[1].strip())
-                if w_part <= 0 or h_part <= 0:
-                    raise ValueError("Ratio parts must be positive")
-                target_ratio = (w_part / h_part).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
+            # Parse the ratio string in a single precompiled-regex scan
+            target_ratio = _parse_ratio(ratio_str)
 
             if target_ratio <= 0:
                  raise ValueError("Calculated ratio must be positive")
 
-            print(f"[Calc Debug] Parsed target ratio: {target_ratio}")
+            log.debug("Parsed target ratio: %s", target_ratio)
 
             # Lock the newly calculated ratio immediately
             self._aspect_ratio = target_ratio
+            self._ratio_dirty = False
             self._ratio_locked = True # Automatically lock after setting ratio this way
 
             # Calculate the dependent value based on the selected base
             if base_on_width:
                 # Calculate height based on current width and new ratio
-                if self._width > 0 and self._aspect_ratio > 0:
-                    new_height = (self._width / self._aspect_ratio).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-                    if new_height > 0:
-                        self._height = new_height
-                        print(f"[Calc Debug] Calculated Height based on Width: {self._height}")
+                if self._width_h > 0 and self._aspect_ratio > 0:
+                    new_height_h = _height_h_from_ratio(self._width_h, self._aspect_ratio)
+                    if new_height_h > 0:
+                        self._height_h = new_height_h
+                        log.debug("Calculated Height based on Width: %s", self.height)
                     else:
-                        print("[Calc Debug Warning] Calculated height non-positive, skipping update.")
+                        log.warning("Calculated height non-positive, skipping update.")
                 else:
-                    print("[Calc Debug Warning] Cannot calculate height based on width (zero width or ratio). Ratio set, but height not updated.")
+                    log.warning("Cannot calculate height based on width (zero width or ratio). Ratio set, but height not updated.")
             else: # Base on height
                 # Calculate width based on current height and new ratio
-                if self._height > 0 and self._aspect_ratio > 0:
-                    new_width = (self._height * self._aspect_ratio).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-                    if new_width > 0:
-                        self._width = new_width
-                        print(f"[Calc Debug] Calculated Width based on Height: {self._width}")
+                if self._height_h > 0 and self._aspect_ratio > 0:
+                    new_width_h = _width_h_from_ratio(self._height_h, self._aspect_ratio)
+                    if new_width_h > 0:
+                        self._width_h = new_width_h
+                        log.debug("Calculated Width based on Height: %s", self.width)
                     else:
-                         print("[Calc Debug Warning] Calculated width non-positive, skipping update.")
+                         log.warning("Calculated width non-positive, skipping update.")
                 else:
-                     print("[Calc Debug Warning] Cannot calculate width based on height (zero height or ratio). Ratio set, but width not updated.")
+                     log.warning("Cannot calculate width based on height (zero height or ratio). Ratio set, but width not updated.")
 
-            print(f"[Calc Debug] set_ratio finished. New W: {self._width}, H: {self._height}, Ratio: {self._aspect_ratio}, Locked: {self._ratio_locked}")
+            log.debug("set_ratio finished. New W: %s, H: %s, Ratio: %s, Locked: %s", self.width, self.height, self._aspect_ratio, self._ratio_locked)
 
-        except (InvalidOperation, ValueError, DivisionByZero) as e:
-            print(f"Error setting ratio: {e}")
+        except (TypeError, ValueError, ZeroDivisionError) as e:
+            log.error("Error setting ratio: %s", e)
             # Optionally, revert lock state or ratio if parsing fails?
-            # For now, just print error and potentially leave state as is. 
+            # For now, just print error and potentially leave state as is.
 
     # --- New properties for integer and decimal parts --- #
+    @staticmethod
+    def _split_cents(cents: int) -> tuple[int, str]:
+        """Splits a hundredths value into its rounded integer part and decimal display part."""
+        int_part = (cents + 50) // 100
+        remainder = abs(cents - int_part * 100)
+        return int_part, (f".{remainder:02d}" if remainder else "")
+
+    def _recompute_derived(self) -> tuple:
+        """Returns the cached derived display values, rebuilding them if stale.
+
+        The tuple layout is (width_int, width_decimal_str, height_int,
+        height_decimal_str, ratio_str, total_pixels); a UI refresh reads
+        most of these together, so they are computed in one pass and
+        reused until a dimension or the ratio changes.
+        """
+        ratio = self.aspect_ratio # Recomputes lazily if dirty
+        key = (self._width_h, self._height_h, ratio)
+        if key == self._derived_key:
+            return self._derived
+
+        width_int, width_decimal_str = self._split_cents(self._width_h)
+        height_int, height_decimal_str = self._split_cents(self._height_h)
+        ratio_str = "N/A" if (ratio is None or ratio == 0) else _format_ratio_str(ratio)
+        self._derived = (width_int, width_decimal_str, height_int, height_decimal_str,
+                         ratio_str, width_int * height_int)
+        self._derived_key = key
+        return self._derived
+
+    def width_parts(self) -> tuple[int, str]:
+        """Returns the width's (integer part, decimal part string) together."""
+        derived = self._recompute_derived()
+        return derived[0], derived[1]
+
+    def height_parts(self) -> tuple[int, str]:
+        """Returns the height's (integer part, decimal part string) together."""
+        derived = self._recompute_derived()
+        return derived[2], derived[3]
+
     @property
     def width_int(self) -> int:
         """Returns the width rounded to the nearest integer."""
-        return int(self._width.to_integral_value(rounding=ROUND_HALF_UP))
+        return self._recompute_derived()[0]
 
     @property
     def height_int(self) -> int:
         """Returns the height rounded to the nearest integer."""
-        return int(self._height.to_integral_value(rounding=ROUND_HALF_UP))
+        return self._recompute_derived()[2]
 
     @property
     def width_decimal_part_str(self) -> str:
         """Returns the decimal part of the width as a string (e.g., '.75'), or empty string if integer."""
-        decimal_part = abs(self._width - Decimal(self.width_int))
-        if decimal_part.is_zero():
-            return ""
-        # Format to two decimal places, remove leading zero
-        return f"{decimal_part:.2f}"[1:] # Example: 0.75 -> .75
+        return self._recompute_derived()[1]
 
     @property
     def height_decimal_part_str(self) -> str:
         """Returns the decimal part of the height as a string (e.g., '.50'), or empty string if integer."""
-        decimal_part = abs(self._height - Decimal(self.height_int))
-        if decimal_part.is_zero():
-            return ""
-        return f"{decimal_part:.2f}"[1:]
+        return self._recompute_derived()[3]
 
     # --- New Property for Total Pixels ---
     @property
-    def total_pixels(self) -> Decimal:
+    def total_pixels(self) -> int:
         """Calculates the total number of pixels (width * height)."""
-        try:
-            # Use integer values for pixel count
-            return Decimal(self.width_int) * Decimal(self.height_int)
-        except Exception:
-            return Decimal("0") # Return 0 if calculation fails
+        return self._recompute_derived()[5]
 
     # --- New Method for Scaling ---
     def multiply_by_scale(self, scale_factor_str: str):
         """Multiplies the current width and height by the given scale factor."""
-        print(f"[Calc Debug] multiply_by_scale called with scale: {scale_factor_str}")
+        log.debug("multiply_by_scale called with scale: %s", scale_factor_str)
         try:
-            scale_factor = Decimal(scale_factor_str)
+            scale_factor = float(scale_factor_str)
             if scale_factor <= 0:
                 raise ValueError("Scale factor must be positive")
 
-            # Store current lock state and temporarily unlock if needed for independent scaling
-            was_locked = self._ratio_locked
-            if was_locked:
-                self.lock_ratio(False) # Temporarily unlock to scale both independently
-
-            new_width = (self._width * scale_factor).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            new_height = (self._height * scale_factor).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            new_width_h, new_height_h = _scale_dims_h(self._width_h, self._height_h, scale_factor)
 
             # Validate before setting
-            if new_width <= 0 or new_height <= 0:
-                 print("[Calc Debug Warning] Scaled dimensions would be non-positive. No change made.")
-                 if was_locked: # Restore lock state if we temporarily unlocked
-                     self.lock_ratio(True)
+            if new_width_h <= 0 or new_height_h <= 0:
+                 log.warning("Scaled dimensions would be non-positive. No change made.")
                  return
 
-            # Use setters to handle potential side effects (like ratio calculation if unlocked)
-            # Note: Since we unlocked, ratio will be recalculated by setters if was_locked was false.
-            # If was_locked was true, we'll re-lock and recalculate below.
-            self.width = new_width
-            self.height = new_height
-
-            # Restore lock state and recalculate ratio if it was locked initially
-            if was_locked:
-                self.lock_ratio(True) # This will recalculate the ratio based on the new W/H
+            # Uniform scaling leaves the aspect ratio mathematically
+            # unchanged, so assign the fields directly and keep the stored
+            # ratio (and lock state) exactly as they were — no unlock/
+            # re-lock, no recalculation.
+            self._width_h = new_width_h
+            self._height_h = new_height_h
 
-            print(f"[Calc Debug] Scaling applied. New W: {self._width}, H: {self._height}, Locked: {self._ratio_locked}, Ratio: {self._aspect_ratio}")
+            log.debug("Scaling applied. New W: %s, H: %s, Locked: %s, Ratio: %s", self.width, self.height, self._ratio_locked, self._aspect_ratio)
 
-        except (InvalidOperation, ValueError) as e:
-            print(f"Error applying scale: {e}")
-            # Consider if we need to restore lock state here as well in case of error mid-process 
\ No newline at end of file
+        except (TypeError, ValueError) as e:
+            log.error("Error applying scale: %s", e)
+            # Consider if we need to restore lock state here as well in case of error mid-process
\ No newline at end of file
@@ -1,8 +1,12 @@
+import logging
 import sys
 from PySide6.QtWidgets import QApplication
 from ui.main_window import MainWindow
 
 if __name__ == "__main__":
+    # Keep debug logging off by default; log.debug calls in the UI hot
+    # paths then short-circuit on the level check without formatting.
+    logging.basicConfig(level=logging.WARNING)
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
@@ -1,18 +1,23 @@
+import logging
 import sys
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QPushButton, QSlider, QCheckBox, QComboBox, QDoubleSpinBox, QSpacerItem, QSizePolicy,
-    QButtonGroup, QRadioButton, QSpinBox, QFrame
+    QLineEdit, QPushButton, QSlider, QCheckBox, QComboBox, QDoubleSpinBox, QSizePolicy,
+    QButtonGroup, QRadioButton, QFrame
 )
-from PySide6.QtCore import Qt, Signal as pyqtSignal, Slot as pyqtSlot, QRectF
-from PySide6.QtGui import QDoubleValidator, QPainter, QColor, QBrush, QPen, QPaintEvent
-from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
+from PySide6.QtCore import Qt, Signal as pyqtSignal, Slot as pyqtSlot, QRectF, QSignalBlocker, QTimer
+from PySide6.QtGui import QDoubleValidator, QPainter, QColor, QBrush, QPen, QPaintEvent, QPixmap
+from contextlib import ExitStack
+from decimal import Decimal, InvalidOperation
 
 from core.calculator import ResolutionCalculator
 from core.presets import get_preset_names, find_preset_by_name
 
+log = logging.getLogger(__name__)
+
 # Constants for slider precision
 SLIDER_PRECISION_MULTIPLIER = 100
+SLIDER_DEBOUNCE_MS = 50 # Coalesce slider ticks before updating the calculator
 DEFAULT_MAX_RESOLUTION_VALUE = 4096 # Default range up to 4K
 EXTENDED_MAX_RESOLUTION_VALUE = 16384 # Extended range
 
@@ -24,124 +29,133 @@ class RatioPreviewWidget(QWidget):
         self.calculator = calculator
         self.setMinimumHeight(180) # Increased minimum height for better vertical display
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-
-    def paintEvent(self, event: QPaintEvent):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        widget_rect = self.rect() # Use the whole widget rect for centering
-        padding = 10
-        # draw_area is still useful for defining bounds, but scale depends mostly on width
-        draw_area = widget_rect.adjusted(padding, padding, -padding, -padding)
-
-        if draw_area.width() <= 0 or draw_area.height() <= 0:
-            return
-
-        painter.fillRect(widget_rect, self.palette().color(self.backgroundRole()))
-
+        # paintEvent fills the whole rect itself, so Qt's pre-erase of the
+        # widget area is a duplicate background fill; skip it.
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        # Geometry cache: the scale and rect math only depends on the widget
+        # size and the calculator dimensions, so repaints at the same state
+        # (e.g. expose events) reuse the last computed rects.
+        self._paint_cache_key = None
+        self._paint_cache = None
+        # The gray 16:9 fill + green FHD outline depend only on widget size;
+        # they are rasterized once per size into this pixmap and blitted.
+        self._bg_pixmap = None
+        # Pens/brushes built once instead of per repaint.
+        self._bg_brush = QBrush(QColor(128, 128, 128, 100))
+        self._fhd_pen = QPen(QColor(0, 180, 0, 200))
+        self._fhd_pen.setStyle(Qt.PenStyle.DashLine)
+        self._fhd_pen.setWidth(1)
+        self._cur_pen = QPen(QColor(0, 0, 200, 150), 1)
+        self._cur_brush = QBrush(QColor(100, 100, 255, 150))
+
+    def resizeEvent(self, event):
+        self._paint_cache_key = None
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+
+    def _compute_rects(self, widget_rect, draw_area):
+        """Computes the (bg_rect, current_rect) pair for the current state."""
+        # Plain float math throughout: the results feed QRectF (doubles), so
+        # Decimal precision bought nothing here, only allocations per paint.
         # --- Determine Scale Factor primarily based on Width fitting FHD --- #
-        fhd_w = Decimal(1920)
-        fhd_h = Decimal(1080)
-        area_w = Decimal(draw_area.width())
-        area_h = Decimal(draw_area.height())
-
         # 1. Calculate the maximum scale that fits FHD within the draw_area
-        max_scale_w = area_w / fhd_w if fhd_w > 0 else Decimal(1)
-        max_scale_h = area_h / fhd_h if fhd_h > 0 else Decimal(1)
-        max_scale = min(max_scale_w, max_scale_h) # Max scale that fits
+        max_scale = min(draw_area.width() / 1920.0, draw_area.height() / 1080.0)
 
         # 2. Set the final drawing scale to be smaller (e.g., 40% of max fit)
-        scale_reduction_factor = Decimal("0.4") # Less than half
-        scale = max_scale * scale_reduction_factor
+        scale = max_scale * 0.4 # Less than half
 
         if scale <= 0:
-             return
+             return None, None
 
         # Center point for drawing all rectangles
         center_x = widget_rect.center().x()
         center_y = widget_rect.center().y()
 
-        # --- Draw 16:9 Aspect Ratio Background (Gray Fill) --- #
-        # Draw this background based on the calculated scale fitting FHD
-        bg_w = float(fhd_w * scale)
-        bg_h = float(fhd_h * scale)
-        bg_x = float(center_x - bg_w / 2)
-        bg_y = float(center_y - bg_h / 2)
-        bg_rect = QRectF(bg_x, bg_y, bg_w, bg_h)
+        # Background/outline rect based on the calculated scale fitting FHD
+        bg_w = 1920.0 * scale
+        bg_h = 1080.0 * scale
+        bg_rect = QRectF(center_x - bg_w / 2, center_y - bg_h / 2, bg_w, bg_h)
 
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(128, 128, 128, 100))
+        current_rect = None
+        try:
+            current_width = self.calculator.width
+            current_height = self.calculator.height
+
+            if current_width > 0 and current_height > 0:
+                # Calculate size based on the *same fixed scale*
+                current_rect_w = current_width * scale
+                current_rect_h = current_height * scale
+                # Position centered in the widget
+                current_rect = QRectF(center_x - current_rect_w / 2,
+                                      center_y - current_rect_h / 2,
+                                      current_rect_w, current_rect_h)
+        except Exception as e:
+            log.error("Error drawing current ratio: %s", e)
+
+        return bg_rect, current_rect
+
+    def _render_bg_pixmap(self, draw_area, bg_rect) -> QPixmap:
+        """Rasterizes the size-dependent background layers into a pixmap."""
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        # No antialiasing: everything here is an axis-aligned rectangle, so
+        # the hint would only double the rasterization cost.
         # Clip the drawing to the padded draw_area to avoid spilling over padding
-        painter.save()
         painter.setClipRect(draw_area)
+
+        # --- Draw 16:9 Aspect Ratio Background (Gray Fill) --- #
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._bg_brush)
         painter.drawRect(bg_rect)
-        painter.restore()
 
         # --- Draw 1920x1080 (FHD) Reference Outline (Green Dashed Line) --- #
         # Uses the same rect as the background
-        fhd_rect = bg_rect
-        fhd_pen = QPen(QColor(0, 180, 0, 200))
-        fhd_pen.setStyle(Qt.PenStyle.DashLine)
-        fhd_pen.setWidth(1)
-        painter.setPen(fhd_pen)
+        painter.setPen(self._fhd_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.save()
-        painter.setClipRect(draw_area)
-        painter.drawRect(fhd_rect)
-        painter.restore()
-
-        # --- Draw Current Resolution Scaled Rectangle (Blue Fill) --- #
-        try:
-            current_width = self.calculator.width
-            current_height = self.calculator.height
+        painter.drawRect(bg_rect)
 
-            if current_width > 0 and current_height > 0:
-                # Calculate size based on the *same fixed scale*
-                current_rect_w = float(current_width * scale)
-                current_rect_h = float(current_height * scale)
-                # Position centered in the widget
-                current_rect_x = float(center_x - current_rect_w / 2)
-                current_rect_y = float(center_y - current_rect_h / 2)
-                current_rect = QRectF(current_rect_x, current_rect_y, current_rect_w, current_rect_h)
+        painter.end()
+        return pixmap
 
-                painter.setPen(QPen(QColor(0, 0, 200, 150), 1))
-                painter.setBrush(QColor(100, 100, 255, 150))
-                painter.save()
-                painter.setClipRect(draw_area) # Clip drawing within the bounds
-                painter.drawRect(current_rect)
-                painter.restore()
+    def paintEvent(self, event: QPaintEvent):
+        # Axis-aligned rectangles only; antialiasing is left off deliberately.
+        painter = QPainter(self)
 
-        except Exception as e:
-            print(f"Error drawing current ratio: {e}")
+        widget_rect = self.rect() # Use the whole widget rect for centering
+        padding = 10
+        # draw_area is still useful for defining bounds, but scale depends mostly on width
+        draw_area = widget_rect.adjusted(padding, padding, -padding, -padding)
 
-    def _calculate_rect_in_area(self, area: QRectF, ratio: Decimal) -> QRectF:
-        """Calculates the largest possible rectangle with the given ratio centered within the area."""
-        if ratio <= 0:
-            return QRectF()
+        if draw_area.width() <= 0 or draw_area.height() <= 0:
+            return
 
-        area_w = Decimal(area.width())
-        area_h = Decimal(area.height())
-        area_ratio = area_w / area_h
+        painter.fillRect(widget_rect, self.palette().color(self.backgroundRole()))
 
-        target_w = area_w
-        target_h = area_h
+        # Clip once for everything that follows; the current-resolution rect
+        # can extend well past the padded area at large dimensions.
+        painter.setClipRect(draw_area)
 
-        if ratio > area_ratio: # Target is wider than area, constrained by width
-            target_h = area_w / ratio
-        else: # Target is taller or same as area, constrained by height
-            target_w = area_h * ratio
+        key = (widget_rect.width(), widget_rect.height(),
+               self.calculator.width, self.calculator.height)
+        if key != self._paint_cache_key:
+            self._paint_cache = self._compute_rects(widget_rect, draw_area)
+            self._paint_cache_key = key
+        bg_rect, current_rect = self._paint_cache
 
-        # Center the rectangle
-        offset_x = (area_w - target_w) / 2
-        offset_y = (area_h - target_h) / 2
+        if bg_rect is None:
+            return
 
-        # Ensure coordinates are float for QRectF
-        final_x = float(area.left() + offset_x)
-        final_y = float(area.top() + offset_y)
-        final_w = float(target_w)
-        final_h = float(target_h)
+        # --- Blit the pre-rendered 16:9 background + FHD outline --- #
+        if self._bg_pixmap is None:
+            self._bg_pixmap = self._render_bg_pixmap(draw_area, bg_rect)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
 
-        return QRectF(final_x, final_y, final_w, final_h)
+        # --- Draw Current Resolution Scaled Rectangle (Blue Fill) --- #
+        if current_rect is not None:
+            painter.setPen(self._cur_pen)
+            painter.setBrush(self._cur_brush)
+            painter.drawRect(current_rect)
 
 
 class MainWindow(QWidget):
@@ -155,9 +169,40 @@ class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.calculator = ResolutionCalculator()
+        # Local preset lookup, built once; combo population and selection
+        # handling reuse these instead of recalling the presets module.
+        self._preset_names = get_preset_names()
+        self._preset_by_name = {name: find_preset_by_name(name) for name in self._preset_names}
         # Keep track of slider range state
         self.current_max_resolution = DEFAULT_MAX_RESOLUTION_VALUE
         self.ratio_preview_widget = None # Initialize preview widget variable
+        # Direct per-axis widget references; avoids getattr(self, f"{name}_...")
+        # string lookups every time the ranges are rebuilt.
+        self._axes = []
+        # State applied by the last _refresh_ui; identical state skips the refresh.
+        self._last_ui_state = None
+        # Last-applied label values; skips reformat + setText when unchanged.
+        self._last_total_pixels = None
+        self._last_ratio_str = None
+        # Zero-timeout coalescing: a burst of calculator updates within one
+        # event-loop turn collapses into a single refresh at idle.
+        self._ui_update_pending = False
+        self._pending_refresh_exclude = None
+        # Debounce timers: a continuous drag updates the labels instantly but
+        # pushes to the calculator only after a short pause (or on release),
+        # instead of running the full update pipeline on every tick.
+        self._pending_width_slider = None
+        self._pending_height_slider = None
+        # Last value actually pushed to the calculator per axis; dragging
+        # back to it cancels the pending push instead of re-sending it.
+        self._last_width_slider_sent = None
+        self._last_height_slider_sent = None
+        self._width_debounce = QTimer(self)
+        self._width_debounce.setSingleShot(True)
+        self._width_debounce.setInterval(SLIDER_DEBOUNCE_MS)
+        self._height_debounce = QTimer(self)
+        self._height_debounce.setSingleShot(True)
+        self._height_debounce.setInterval(SLIDER_DEBOUNCE_MS)
         self.init_ui()
         self.connect_signals()
         self.update_ui_from_calculator() # Initialize UI with default values
@@ -172,12 +217,12 @@ class MainWindow(QWidget):
         preset_layout = QHBoxLayout()
         preset_label = QLabel("Presets:")
         self.preset_combo = QComboBox()
-        self.preset_combo.addItems(["-- Select Preset --"] + get_preset_names())
+        self.preset_combo.addItems(["-- Select Preset --"] + self._preset_names)
         preset_layout.addWidget(preset_label)
         preset_layout.addWidget(self.preset_combo)
         main_layout.addLayout(preset_layout)
 
-        main_layout.addSpacerItem(QSpacerItem(20, 10, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
+        main_layout.addSpacing(10)
 
         # --- Width --- #
         width_layout = self._create_value_slider_layout("Width:", "width")
@@ -196,11 +241,11 @@ class MainWindow(QWidget):
 
         pixels_and_range_layout.addWidget(pixels_label)
         pixels_and_range_layout.addWidget(self.total_pixels_label)
-        pixels_and_range_layout.addSpacerItem(QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
+        pixels_and_range_layout.addStretch(1)
         pixels_and_range_layout.addWidget(self.range_button)
         main_layout.addLayout(pixels_and_range_layout)
 
-        main_layout.addSpacerItem(QSpacerItem(20, 10, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
+        main_layout.addSpacing(10)
 
         # --- Aspect Ratio Display & Lock --- #
         ratio_display_lock_layout = QHBoxLayout()
@@ -209,7 +254,7 @@ class MainWindow(QWidget):
         self.lock_ratio_checkbox = QCheckBox("Lock Ratio")
         ratio_display_lock_layout.addWidget(ratio_label)
         ratio_display_lock_layout.addWidget(self.ratio_display_label, 1)
-        ratio_display_lock_layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
+        ratio_display_lock_layout.addStretch(1)
         ratio_display_lock_layout.addWidget(self.lock_ratio_checkbox)
         main_layout.addLayout(ratio_display_lock_layout)
 
@@ -249,7 +294,7 @@ class MainWindow(QWidget):
         scale_layout.addWidget(self.scale_input_edit, 1) # Use the new QLineEdit
         main_layout.addLayout(scale_layout)
 
-        main_layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)) # Adjusted spacer
+        main_layout.addSpacing(20) # Adjusted spacer
 
         # --- Add Ratio Preview Widget --- #
         self.ratio_preview_widget = RatioPreviewWidget(self.calculator)
@@ -260,17 +305,20 @@ class MainWindow(QWidget):
         self._update_widget_ranges()
 
     def _create_value_slider_layout(self, label_text: str, value_attr_name: str) -> QHBoxLayout:
-        """Helper to create a layout with Label, SpinBox, Decimal Label, and Slider."""
+        """Helper to create a layout with Label, SpinBox, and Slider."""
         layout = QHBoxLayout()
         label = QLabel(label_text)
-        spinbox = QSpinBox()
-        decimal_label = QLabel("")
-        decimal_label.setMinimumWidth(30)
+        # One QDoubleSpinBox carries the full 0.01 precision; no separate
+        # decimal QLabel to keep in sync on every tick.
+        spinbox = QDoubleSpinBox()
         slider = QSlider(Qt.Orientation.Horizontal)
 
-        spinbox.setRange(1, EXTENDED_MAX_RESOLUTION_VALUE)
+        spinbox.setRange(1.0, EXTENDED_MAX_RESOLUTION_VALUE)
+        spinbox.setDecimals(2)
         spinbox.setSingleStep(1)
-        spinbox.setButtonSymbols(QSpinBox.ButtonSymbols.NoButtons)
+        spinbox.setButtonSymbols(QDoubleSpinBox.ButtonSymbols.NoButtons)
+        # Only emit valueChanged on Enter/focus-out, not on every keystroke
+        spinbox.setKeyboardTracking(False)
 
         slider.setRange(1 * SLIDER_PRECISION_MULTIPLIER, EXTENDED_MAX_RESOLUTION_VALUE * SLIDER_PRECISION_MULTIPLIER)
         slider.setSingleStep(1 * SLIDER_PRECISION_MULTIPLIER)
@@ -278,12 +326,11 @@ class MainWindow(QWidget):
 
         layout.addWidget(label)
         layout.addWidget(spinbox)
-        layout.addWidget(decimal_label)
         layout.addWidget(slider, 1)
 
         setattr(self, f"{value_attr_name}_spinbox", spinbox)
-        setattr(self, f"{value_attr_name}_decimal_label", decimal_label)
         setattr(self, f"{value_attr_name}_slider", slider)
+        self._axes.append((spinbox, slider, value_attr_name))
 
         return layout
 
@@ -292,12 +339,18 @@ class MainWindow(QWidget):
         # --- UI -> Internal Slots ---
         self.width_spinbox.valueChanged.connect(self._emit_width_changed_from_spinbox)
         self.height_spinbox.valueChanged.connect(self._emit_height_changed_from_spinbox)
-        self.width_slider.valueChanged.connect(self._handle_slider_value_changed)
-        self.height_slider.valueChanged.connect(self._handle_slider_value_changed)
-
-        self.lock_ratio_checkbox.stateChanged.connect(
-            self._handle_lock_checkbox_change
-        )
+        # Per-axis slots: no self.sender() lookup or dispatch branch per tick
+        self.width_slider.valueChanged.connect(self._handle_width_slider_changed)
+        self.height_slider.valueChanged.connect(self._handle_height_slider_changed)
+        # Debounced slider -> calculator path; releasing the handle flushes immediately
+        self._width_debounce.timeout.connect(self._flush_width_slider)
+        self._height_debounce.timeout.connect(self._flush_height_slider)
+        self.width_slider.sliderReleased.connect(self._flush_width_slider)
+        self.height_slider.sliderReleased.connect(self._flush_height_slider)
+
+        # toggled(bool) delivers the checked state directly; no CheckState
+        # enum unwrapping per toggle.
+        self.lock_ratio_checkbox.toggled.connect(self._handle_lock_checkbox_change)
         self.preset_combo.currentIndexChanged.connect(self._handle_preset_selection)
 
         # --- New Connections ---
@@ -309,44 +362,81 @@ class MainWindow(QWidget):
         self.scale_input_edit.returnPressed.connect(self._handle_scale_input)
 
         # --- Internal Signals -> Calculator Logic (via slots) ---
+        # Every receiver is a @Slot-decorated method so PySide registers a
+        # real meta-object slot instead of a heavier dynamic one at connect
+        # time. The calculator itself stays Qt-free, so the lock signal goes
+        # through a decorated forwarding slot rather than connecting to
+        # calculator.lock_ratio directly.
         self.width_changed.connect(self._update_calculator_width)
         self.height_changed.connect(self._update_calculator_height)
-        self.lock_ratio_changed.connect(self.calculator.lock_ratio)
+        self.lock_ratio_changed.connect(self._update_calculator_lock)
         self.preset_selected.connect(self._apply_preset)
 
     # --- Slots for handling UI events --- #
 
-    @pyqtSlot(int)
-    def _emit_width_changed_from_spinbox(self, value: int):
-        print(f"[UI Debug] Width SpinBox changed: {value}")
-        self.width_changed.emit(str(value))
+    @pyqtSlot(float)
+    def _emit_width_changed_from_spinbox(self, value: float):
+        log.debug("Width SpinBox changed: %s", value)
+        self.width_changed.emit(f"{value:.2f}")
+
+    @pyqtSlot(float)
+    def _emit_height_changed_from_spinbox(self, value: float):
+        log.debug("Height SpinBox changed: %s", value)
+        self.height_changed.emit(f"{value:.2f}")
 
     @pyqtSlot(int)
-    def _emit_height_changed_from_spinbox(self, value: int):
-        print(f"[UI Debug] Height SpinBox changed: {value}")
-        self.height_changed.emit(str(value))
+    def _handle_width_slider_changed(self, slider_value: int):
+        """Handles width slider ticks: visual sync plus debounced calculator push."""
+        # Sync the spinbox visually *without* emitting signals
+        self._sync_slider(slider_value, self.width_spinbox)
+        # Back at the value the calculator already has: drop the pending push.
+        if slider_value == self._last_width_slider_sent:
+            self._pending_width_slider = None
+            self._width_debounce.stop()
+            return
+        # Store the pending value and (re)start the debounce; the calculator
+        # update fires on timeout or on slider release, whichever is first.
+        self._pending_width_slider = slider_value
+        self._width_debounce.start()
 
     @pyqtSlot(int)
-    def _handle_slider_value_changed(self, slider_value: int):
-        """Handles the valueChanged signal from sliders for real-time updates."""
-        sender = self.sender()
-        precise_value = Decimal(slider_value) / Decimal(SLIDER_PRECISION_MULTIPLIER)
-        print(f"[UI Debug] Slider value changed. Precise value: {precise_value:.2f}")
+    def _handle_height_slider_changed(self, slider_value: int):
+        """Handles height slider ticks: visual sync plus debounced calculator push."""
+        self._sync_slider(slider_value, self.height_spinbox)
+        if slider_value == self._last_height_slider_sent:
+            self._pending_height_slider = None
+            self._height_debounce.stop()
+            return
+        self._pending_height_slider = slider_value
+        self._height_debounce.start()
 
-        # Sync the corresponding spinbox/decimal display visually *without* emitting signals from them
-        self._sync_slider_to_spinbox(slider_value)
+    @pyqtSlot()
+    def _flush_width_slider(self):
+        """Emits the pending debounced width slider value to the calculator path."""
+        self._width_debounce.stop()
+        if self._pending_width_slider is None:
+            return
+        int_part, frac = divmod(self._pending_width_slider, SLIDER_PRECISION_MULTIPLIER)
+        self._last_width_slider_sent = self._pending_width_slider
+        self._pending_width_slider = None
+        self.width_changed.emit(f"{int_part}.{frac:02d}")
 
-        # Emit the precise value change signal
-        if sender == self.width_slider:
-            self.width_changed.emit(str(precise_value))
-        elif sender == self.height_slider:
-            self.height_changed.emit(str(precise_value))
+    @pyqtSlot()
+    def _flush_height_slider(self):
+        """Emits the pending debounced height slider value to the calculator path."""
+        self._height_debounce.stop()
+        if self._pending_height_slider is None:
+            return
+        int_part, frac = divmod(self._pending_height_slider, SLIDER_PRECISION_MULTIPLIER)
+        self._last_height_slider_sent = self._pending_height_slider
+        self._pending_height_slider = None
+        self.height_changed.emit(f"{int_part}.{frac:02d}")
 
     @pyqtSlot(int)
     def _handle_preset_selection(self, index: int):
         if index > 0: # Ignore the default "-- Select Preset --" item
             preset_name = self.preset_combo.itemText(index)
-            print(f"[UI Debug] Preset selected: {preset_name}")
+            log.debug("Preset selected: %s", preset_name)
             self.preset_selected.emit(preset_name)
 
             # Reset the combo box to the default item after applying
@@ -355,184 +445,220 @@ class MainWindow(QWidget):
             self.preset_combo.blockSignals(False)
         # If index is 0, we might want to do nothing or clear fields, TBD.
 
-    @pyqtSlot(int)
-    def _handle_lock_checkbox_change(self, state: int):
-        is_checked = (state == Qt.CheckState.Checked.value)
-        print(f"[UI Debug] Checkbox state changed. Raw state: {state}, Is Checked: {is_checked}")
+    @pyqtSlot(bool)
+    def _handle_lock_checkbox_change(self, is_checked: bool):
+        log.debug("Checkbox toggled. Is Checked: %s", is_checked)
         self.lock_ratio_changed.emit(is_checked)
-        print(f"[UI Debug] lock_ratio_changed signal emitted with: {is_checked}")
 
     # --- Slots for updating the calculator --- #
+    @pyqtSlot(bool)
+    def _update_calculator_lock(self, locked: bool):
+        """Slot to update the calculator's ratio lock state."""
+        self.calculator.lock_ratio(locked)
+
     @pyqtSlot(str)
     def _update_calculator_width(self, value_str: str):
         """Slot to update the calculator's width property."""
-        print(f"[UI Debug] _update_calculator_width called with: {value_str}")
+        log.debug("_update_calculator_width called with: %s", value_str)
         try:
             locked_before = self.calculator.is_ratio_locked
-            print(f"[UI Debug] Before width update - Locked: {locked_before}")
+            log.debug("Before width update - Locked: %s", locked_before)
 
             self.calculator.width = value_str
 
             locked_after = self.calculator.is_ratio_locked
-            print(f"[UI Debug] After width update - Locked: {locked_after}")
+            log.debug("After width update - Locked: %s", locked_after)
 
-            print("[UI Debug] Calling update_ui_from_calculator after width update")
-            self.update_ui_from_calculator()
+            # Mid-drag the width widgets were just synced by
+            # _sync_slider, so only the dependent widgets need
+            # refreshing; a typed spinbox edit still gets the full pass.
+            exclude = ("width",) if self.width_slider.isSliderDown() else ()
+            self._schedule_ui_update(exclude=exclude)
         except Exception as e:
-            print(f"Error updating calculator width: {e}")
+            log.error("Error updating calculator width: %s", e)
 
     @pyqtSlot(str)
     def _update_calculator_height(self, value_str: str):
         """Slot to update the calculator's height property."""
-        print(f"[UI Debug] _update_calculator_height called with: {value_str}")
+        log.debug("_update_calculator_height called with: %s", value_str)
         try:
             locked_before = self.calculator.is_ratio_locked
-            print(f"[UI Debug] Before height update - Locked: {locked_before}")
+            log.debug("Before height update - Locked: %s", locked_before)
 
             self.calculator.height = value_str
 
             locked_after = self.calculator.is_ratio_locked
-            print(f"[UI Debug] After height update - Locked: {locked_after}")
+            log.debug("After height update - Locked: %s", locked_after)
 
-            print("[UI Debug] Calling update_ui_from_calculator after height update")
-            self.update_ui_from_calculator()
+            exclude = ("height",) if self.height_slider.isSliderDown() else ()
+            self._schedule_ui_update(exclude=exclude)
         except Exception as e:
-            print(f"Error updating calculator height: {e}")
+            log.error("Error updating calculator height: %s", e)
 
     @pyqtSlot(str)
     def _apply_preset(self, preset_name: str):
-        preset = find_preset_by_name(preset_name)
+        preset = self._preset_by_name.get(preset_name)
         if preset:
-            is_locked = self.calculator.is_ratio_locked
-            if is_locked:
-                self.calculator.lock_ratio(False)
-
-            self.calculator.width = preset.width
-            self.calculator.height = preset.height
-
-            if is_locked:
-                self.calculator.lock_ratio(True)
-
-            self.update_ui_from_calculator()
+            # Single batched write: one ratio recompute instead of the old
+            # unlock/set width/set height/relock sequence.
+            self.calculator.set_dimensions(preset.width, preset.height)
+            self._refresh_ui()
         else:
-            print(f"Warning: Preset '{preset_name}' not found.")
+            log.warning("Preset '%s' not found.", preset_name)
 
     # --- Update UI --- #
     def update_ui_from_calculator(self):
         """Updates all relevant UI elements based on the calculator's state."""
-        print("[UI Debug] update_ui_from_calculator called.")
+        self._refresh_ui()
+
+    def _schedule_ui_update(self, exclude=()):
+        """Schedules a coalesced refresh for the end of the event-loop turn.
+
+        Several calculator writes in one turn (e.g. both axes moving under a
+        ratio lock) then repaint once instead of per write.
+        """
+        if self._ui_update_pending:
+            # Keep only the exclusions every pending request agreed on.
+            self._pending_refresh_exclude = tuple(
+                set(self._pending_refresh_exclude) & set(exclude))
+            return
+        self._ui_update_pending = True
+        self._pending_refresh_exclude = tuple(exclude)
+        QTimer.singleShot(0, self._flush_ui_update)
+
+    @pyqtSlot()
+    def _flush_ui_update(self):
+        """Runs the refresh scheduled by _schedule_ui_update."""
+        self._ui_update_pending = False
+        exclude = self._pending_refresh_exclude or ()
+        self._pending_refresh_exclude = None
+        self._refresh_ui(exclude=exclude)
+
+    def _refresh_ui(self, exclude=()):
+        """Refreshes UI widgets from the calculator, skipping axes in `exclude`.
+
+        Callers pass the axis the user is actively dragging, since its
+        spinbox/slider were already synced by `_sync_slider`;
+        only the dependent axis, ratio label and totals then need rewriting.
+        """
+        log.debug("_refresh_ui called (exclude=%s).", exclude)
+        # Memoized side effects: a re-emission of the current value (Enter on
+        # an unchanged spinbox, dragging a slider back to its origin) leaves
+        # the calculator state identical, so the whole refresh can be skipped.
+        state = (self.calculator.width, self.calculator.height,
+                 self.calculator.aspect_ratio, self.calculator.is_ratio_locked,
+                 self.current_max_resolution)
+        if state == self._last_ui_state:
+            log.debug("_refresh_ui skipped: state unchanged.")
+            return
+
         calculator_locked_state = self.calculator.is_ratio_locked
         checkbox_current_state = self.lock_ratio_checkbox.isChecked()
-        print(f"[UI Debug] Updating UI. Calculator locked: {calculator_locked_state}, Checkbox currently: {checkbox_current_state}")
-
-        self.width_spinbox.blockSignals(True)
-        self.width_slider.blockSignals(True)
-        self.width_decimal_label.blockSignals(True)
-        self.height_spinbox.blockSignals(True)
-        self.height_slider.blockSignals(True)
-        self.height_decimal_label.blockSignals(True)
-        self.lock_ratio_checkbox.blockSignals(True)
-        self.preset_combo.blockSignals(True)
-
-        width_precise = self.calculator.width
-        height_precise = self.calculator.height
-        width_int = self.calculator.width_int
-        height_int = self.calculator.height_int
-        width_decimal_str = self.calculator.width_decimal_part_str
-        height_decimal_str = self.calculator.height_decimal_part_str
-
-        self.width_spinbox.setValue(width_int)
-        self.width_decimal_label.setText(width_decimal_str)
-        self.height_spinbox.setValue(height_int)
-        self.height_decimal_label.setText(height_decimal_str)
-
-        self.width_slider.setValue(int(width_precise * SLIDER_PRECISION_MULTIPLIER))
-        self.height_slider.setValue(int(height_precise * SLIDER_PRECISION_MULTIPLIER))
-
-        self.ratio_display_label.setText(self.calculator.aspect_ratio_str)
-
-        if checkbox_current_state != calculator_locked_state:
-             print(f"[UI Debug] Checkbox state mismatch! Setting checkbox to: {calculator_locked_state}")
-             self.lock_ratio_checkbox.setChecked(calculator_locked_state)
-        else:
-             print("[UI Debug] Checkbox state matches calculator. No change needed.")
-
-        self.width_spinbox.blockSignals(False)
-        self.width_slider.blockSignals(False)
-        self.width_decimal_label.blockSignals(False)
-        self.height_spinbox.blockSignals(False)
-        self.height_slider.blockSignals(False)
-        self.height_decimal_label.blockSignals(False)
-        self.lock_ratio_checkbox.blockSignals(False)
-        self.preset_combo.blockSignals(False)
-
-        # Update total pixels display
+        log.debug("Updating UI. Calculator locked: %s, Checkbox currently: %s", calculator_locked_state, checkbox_current_state)
+
+        # Coalesce the individual setValue/setText repaints into one paint
+        # event; re-enabled in the finally even if a write raises.
+        self.setUpdatesEnabled(False)
         try:
-            total_pixels_val = self.calculator.total_pixels
-            self.total_pixels_label.setText(f"{total_pixels_val:,.0f}") # Use :.0f to avoid decimals for pixels
-        except Exception as e:
-            print(f"Error updating total pixels display: {e}")
-            self.total_pixels_label.setText("Error")
+            # RAII signal blocking; each widget is only written when its value
+            # actually changed, so unchanged widgets skip Qt's setValue/repaint
+            # pipeline entirely.
+            with (QSignalBlocker(self.width_spinbox), QSignalBlocker(self.width_slider),
+                  QSignalBlocker(self.height_spinbox), QSignalBlocker(self.height_slider),
+                  QSignalBlocker(self.lock_ratio_checkbox), QSignalBlocker(self.preset_combo)):
+                if "width" not in exclude:
+                    width_val = self.calculator.width
+                    width_slider_val = self.calculator.width_slider_units
+                    if self.width_spinbox.value() != width_val:
+                        self.width_spinbox.setValue(width_val)
+                    if self.width_slider.value() != width_slider_val:
+                        self.width_slider.setValue(width_slider_val)
+                    # The slider now mirrors the calculator, so this is the
+                    # value a future drag does not need to re-send.
+                    self._last_width_slider_sent = width_slider_val
+
+                if "height" not in exclude:
+                    height_val = self.calculator.height
+                    height_slider_val = self.calculator.height_slider_units
+                    if self.height_spinbox.value() != height_val:
+                        self.height_spinbox.setValue(height_val)
+                    if self.height_slider.value() != height_slider_val:
+                        self.height_slider.setValue(height_slider_val)
+                    self._last_height_slider_sent = height_slider_val
+
+                ratio_str = self.calculator.aspect_ratio_str
+                if ratio_str != self._last_ratio_str:
+                    self.ratio_display_label.setText(ratio_str)
+                    self._last_ratio_str = ratio_str
+
+                if checkbox_current_state != calculator_locked_state:
+                    log.debug("Checkbox state mismatch! Setting checkbox to: %s", calculator_locked_state)
+                    self.lock_ratio_checkbox.setChecked(calculator_locked_state)
+
+            # Update total pixels display; the comma-grouped format only runs
+            # when the value actually changed.
+            try:
+                total_pixels_val = self.calculator.total_pixels
+                if total_pixels_val != self._last_total_pixels:
+                    self.total_pixels_label.setText(f"{total_pixels_val:,.0f}") # Use :.0f to avoid decimals for pixels
+                    self._last_total_pixels = total_pixels_val
+            except Exception as e:
+                log.error("Error updating total pixels display: %s", e)
+                self.total_pixels_label.setText("Error")
+                self._last_total_pixels = None
+        finally:
+            self.setUpdatesEnabled(True)
 
         # --- Trigger Ratio Preview Update --- #
         if self.ratio_preview_widget:
             self.ratio_preview_widget.update() # Tell the preview widget to repaint
 
-        print("[UI Debug] update_ui_from_calculator finished.")
+        self._last_ui_state = state
+        log.debug("_refresh_ui finished.")
 
     def _update_widget_ranges(self):
         """Sets the min/max for sliders and spinboxes based on current_max_resolution."""
-        max_val_precise = Decimal(self.current_max_resolution)
-        max_val_int = int(max_val_precise.to_integral_value(rounding=ROUND_HALF_UP))
-        slider_max = int(max_val_precise * SLIDER_PRECISION_MULTIPLIER)
-
-        print(f"[UI Debug] Updating widget ranges. Max int val: {max_val_int}")
-
-        self.width_spinbox.blockSignals(True)
-        self.width_slider.blockSignals(True)
-        self.width_decimal_label.blockSignals(True)
-        self.height_spinbox.blockSignals(True)
-        self.height_slider.blockSignals(True)
-        self.height_decimal_label.blockSignals(True)
-
-        for name in ["width", "height"]:
-            spinbox = getattr(self, f"{name}_spinbox")
-            slider = getattr(self, f"{name}_slider")
-
-            current_spin_value = spinbox.value()
-            current_precise_value = getattr(self.calculator, name)
-
-            spinbox.setRange(1, max_val_int)
-            slider.setRange(1 * SLIDER_PRECISION_MULTIPLIER, slider_max)
-
-            if current_precise_value > max_val_precise:
-                setattr(self.calculator, name, str(max_val_precise))
-                spinbox.setValue(max_val_int)
-                slider.setValue(slider_max)
-                decimal_label = getattr(self, f"{name}_decimal_label")
-                decimal_label.setText(getattr(self.calculator, f"{name}_decimal_part_str"))
-            else:
-                spinbox.setValue(current_spin_value)
-                slider.setValue(int(current_precise_value * SLIDER_PRECISION_MULTIPLIER))
-                decimal_label = getattr(self, f"{name}_decimal_label")
-                decimal_label.setText(getattr(self.calculator, f"{name}_decimal_part_str"))
+        # current_max_resolution is already an int; no Decimal round trip needed
+        max_val_int = self.current_max_resolution
+        slider_max = max_val_int * SLIDER_PRECISION_MULTIPLIER
 
-        if self.current_max_resolution == DEFAULT_MAX_RESOLUTION_VALUE:
-            self.range_button.setText(f"Extend Range (>{DEFAULT_MAX_RESOLUTION_VALUE})")
-        else:
-            self.range_button.setText(f"Reset Range (≤{DEFAULT_MAX_RESOLUTION_VALUE})")
+        log.debug("Updating widget ranges. Max int val: %s", max_val_int)
 
-        self.width_spinbox.blockSignals(False)
-        self.width_slider.blockSignals(False)
-        self.width_decimal_label.blockSignals(False)
-        self.height_spinbox.blockSignals(False)
-        self.height_slider.blockSignals(False)
-        self.height_decimal_label.blockSignals(False)
+        # Range changes can invalidate the whole layout; batch the repaints
+        # into one paint event.
+        self.setUpdatesEnabled(False)
+        try:
+            # RAII signal blocking, unwound even if a write raises.
+            with ExitStack() as blockers:
+                for spinbox, slider, _ in self._axes:
+                    blockers.enter_context(QSignalBlocker(spinbox))
+                    blockers.enter_context(QSignalBlocker(slider))
+
+                for spinbox, slider, name in self._axes:
+                    current_precise_value = getattr(self.calculator, name)
+
+                    spinbox.setRange(1.0, max_val_int)
+                    slider.setRange(1 * SLIDER_PRECISION_MULTIPLIER, slider_max)
+
+                    if current_precise_value > max_val_int:
+                        setattr(self.calculator, name, max_val_int)
+                        spinbox.setValue(max_val_int)
+                        slider.setValue(slider_max)
+                    else:
+                        spinbox.setValue(current_precise_value)
+                        slider.setValue(getattr(self.calculator, name + "_slider_units"))
+
+                if self.current_max_resolution == DEFAULT_MAX_RESOLUTION_VALUE:
+                    self.range_button.setText(f"Extend Range (>{DEFAULT_MAX_RESOLUTION_VALUE})")
+                else:
+                    self.range_button.setText(f"Reset Range (≤{DEFAULT_MAX_RESOLUTION_VALUE})")
+        finally:
+            self.setUpdatesEnabled(True)
 
     @pyqtSlot()
     def _handle_range_button(self):
         """Toggles the slider/spinbox range between default and extended."""
-        print("[UI Debug] Range button clicked.")
+        log.debug("Range button clicked.")
         if self.current_max_resolution == DEFAULT_MAX_RESOLUTION_VALUE:
             self.current_max_resolution = EXTENDED_MAX_RESOLUTION_VALUE
         else:
@@ -547,10 +673,10 @@ class MainWindow(QWidget):
         if not ratio_text:
             return
 
-        print(f"[UI Debug] Ratio input entered: '{ratio_text}'")
+        log.debug("Ratio input entered: '%s'", ratio_text)
 
         base_on_width = self.base_width_radio.isChecked()
-        print(f"[UI Debug] Ratio base selected: {'Width' if base_on_width else 'Height'}")
+        log.debug("Ratio base selected: %s", "Width" if base_on_width else "Height")
 
         self.calculator.set_ratio_and_calculate(ratio_text, base_on_width)
 
@@ -568,61 +694,30 @@ class MainWindow(QWidget):
             # Attempt to convert text to Decimal for validation
             scale_factor = Decimal(scale_text)
             if scale_factor <= 0:
-                 print("[UI Debug Warning] Scale factor must be positive.")
+                 log.warning("Scale factor must be positive.")
                  # Maybe add user feedback here (e.g., status bar message or brief popup)
                  return
 
-            print(f"[UI Debug] Scale input Enter pressed. Factor: {scale_factor}")
+            log.debug("Scale input Enter pressed. Factor: %s", scale_factor)
             self.calculator.multiply_by_scale(scale_text) # Pass the original string
             self.update_ui_from_calculator() # Update UI after scaling
             # Clear the input field after successful application?
             # self.scale_input_edit.clear() # Consider uncommenting this line
 
         except InvalidOperation:
-            print(f"[UI Debug Error] Invalid scale factor input: {scale_text}")
+            log.error("Invalid scale factor input: %s", scale_text)
             # Add user feedback here as well
         except ValueError as e:
-             print(f"[UI Debug Error] Error applying scale: {e}")
+             log.error("Error applying scale: %s", e)
         except Exception as e:
-            print(f"Error in scaling operation from UI: {e}")
-
-    @pyqtSlot(int)
-    def _sync_slider_to_spinbox(self, slider_value: int):
-        """Visually synchronizes the SpinBox and Decimal Label with the Slider's value."""
-        sender = self.sender()
-        target_spinbox = None
-        target_decimal_label = None
-
-        # Determine which slider triggered the change
-        if sender == self.width_slider:
-            target_spinbox = self.width_spinbox
-            target_decimal_label = self.width_decimal_label
-        elif sender == self.height_slider:
-            target_spinbox = self.height_spinbox
-            target_decimal_label = self.height_decimal_label
-        else:
-            # If called unexpectedly (e.g., during setup), find the target based on slider value
-            # This might happen if update_ui calls this indirectly before sender is set? Unlikely but safe.
-            if hasattr(self, 'width_slider') and self.width_slider.value() == slider_value:
-                 target_spinbox = self.width_spinbox
-                 target_decimal_label = self.width_decimal_label
-            elif hasattr(self, 'height_slider') and self.height_slider.value() == slider_value:
-                 target_spinbox = self.height_spinbox
-                 target_decimal_label = self.height_decimal_label
-            else:
-                print("[UI Debug Warning] _sync_slider_to_spinbox called without identifiable sender or matching value.")
-                return
-
-        precise_value = Decimal(slider_value) / Decimal(SLIDER_PRECISION_MULTIPLIER)
-        int_value = int(precise_value.to_integral_value(rounding=ROUND_HALF_UP))
-        decimal_part = abs(precise_value - Decimal(int_value))
-        decimal_str = f"{decimal_part:.2f}"[1:] if not decimal_part.is_zero() else ""
+            log.error("Error in scaling operation from UI: %s", e)
 
+    def _sync_slider(self, slider_value: int, target_spinbox):
+        """Visually synchronizes a SpinBox with a Slider's value."""
         # Block signals to prevent infinite loops
         target_spinbox.blockSignals(True)
-        target_spinbox.setValue(int_value)
+        target_spinbox.setValue(slider_value / SLIDER_PRECISION_MULTIPLIER)
         target_spinbox.blockSignals(False)
-        target_decimal_label.setText(decimal_str)
 
 # Example of how to run this window directly (for testing)
 if __name__ == '__main__':